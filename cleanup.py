@@ -4,33 +4,31 @@ Removes unnecessary files and creates .gitignore.
 """
 
 import os
-import glob
 
 
 def cleanup():
     """Clean up project directory for submission."""
 
-    # List of file prefixes to delete
-    prefixes_to_delete = ['AUDIT', 'ISSUES',
-                          'FINAL', 'DETAILED', 'DELIVERY', '00_START']
+    # File prefixes to delete; startswith accepts the whole tuple at once
+    prefixes_to_delete = ('AUDIT', 'ISSUES',
+                          'FINAL', 'DETAILED', 'DELIVERY', '00_START')
 
     # Get current directory
     current_dir = os.getcwd()
 
-    # Delete files matching prefixes
+    # Delete files matching prefixes in a single directory scan
     deleted_count = 0
-    for prefix in prefixes_to_delete:
-        pattern = os.path.join(current_dir, f'{prefix}*')
-        files_to_delete = glob.glob(pattern)
-
-        for file_path in files_to_delete:
+    with os.scandir(current_dir) as entries:
+        for entry in entries:
+            if not entry.name.startswith(prefixes_to_delete):
+                continue
             try:
-                if os.path.isfile(file_path):
-                    os.remove(file_path)
+                if entry.is_file():
+                    os.remove(entry.path)
                     deleted_count += 1
-                    print(f"Deleted: {os.path.basename(file_path)}")
-            except Exception as e:
-                print(f"Error deleting {file_path}: {e}")
+                    print(f"Deleted: {entry.name}")
+            except OSError as e:
+                print(f"Error deleting {entry.path}: {e}")
 
     # Create .gitignore if it doesn't exist
     gitignore_path = os.path.join(current_dir, '.gitignore')
@@ -6,6 +6,7 @@ Orchestrates data ingestion, processing, visualization, and report generation.
 import os
 import sys
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 import importlib.util
 
@@ -31,10 +32,7 @@ classes = importlib.util.module_from_spec(classes_spec)
 classes_spec.loader.exec_module(classes)
 
 DataProcessor = data_processor.DataProcessor
-calculate_daily_totals = data_processor.calculate_daily_totals
-calculate_weekly_aggregates = data_processor.calculate_weekly_aggregates
-building_wise_summary = data_processor.building_wise_summary
-hourly_peak_analysis = data_processor.hourly_peak_analysis
+aggregate_all = data_processor.aggregate_all
 export_cleaned_data = data_processor.export_cleaned_data
 export_building_summary = data_processor.export_building_summary
 
@@ -84,11 +82,9 @@ def main():
     print("[STEP 2] DATA AGGREGATION AND ANALYSIS")
     print("-" * 70)
 
-    # Calculate aggregations
-    daily_totals = calculate_daily_totals(df_combined)
-    weekly_aggregates = calculate_weekly_aggregates(df_combined)
-    building_summary = building_wise_summary(df_combined)
-    hourly_peaks = hourly_peak_analysis(df_combined)
+    # Calculate aggregations in one shared pass (weekly derives from daily)
+    daily_totals, weekly_aggregates, building_summary, hourly_peaks = \
+        aggregate_all(df_combined)
 
     print(f"[OK] Daily totals calculated: {len(daily_totals)} days of data")
     print(f"[OK] Weekly aggregates calculated: {len(weekly_aggregates)} weeks")
@@ -138,20 +134,25 @@ def main():
     # Create building objects and populate them
     manager = BuildingManager()
 
-    for building_name in df_combined['building_name'].unique():
+    # Partition the frame once with groupby and hand each building its
+    # columns as arrays - no per-row objects are created at all
+    def build_building(group):
+        building_name, building_data = group
         building = Building(building_name)
-        building_data = df_combined[df_combined['building_name']
-                                    == building_name]
-
-        for _, row in building_data.iterrows():
-            reading = MeterReading(
-                timestamp=row['date'].strftime('%Y-%m-%d'),
-                kwh=row['kwh'],
-                time_slot=row['time']
-            )
-            building.add_reading(reading)
-
-        manager.add_building(building)
+        building.add_readings(
+            building_data['kwh'].to_numpy(dtype='float64'),
+            building_data['date'].to_numpy(dtype='datetime64[D]'),
+            building_data['time'].to_numpy()
+        )
+        return building
+
+    # Threads suffice here: the per-group work is numpy/pandas array
+    # conversion, which releases the GIL
+    with ThreadPoolExecutor() as executor:
+        for building in executor.map(
+                build_building,
+                df_combined.groupby('building_name', sort=False, observed=True)):
+            manager.add_building(building)
 
     # Generate reports
     campus_report = manager.generate_campus_report()
@@ -163,8 +164,8 @@ def main():
     print("[STEP 6] EXECUTIVE SUMMARY")
     print("-" * 70)
 
-    # Calculate key metrics
-    total_consumption = df_combined['kwh'].sum()
+    # Calculate key metrics (upcast so the report sum keeps full precision)
+    total_consumption = df_combined['kwh'].astype('float64').sum()
     highest_building = building_summary.iloc[0]
     lowest_building = building_summary.iloc[-1]
 
@@ -4,23 +4,34 @@ Defines Building, MeterReading, and BuildingManager classes.
 """
 
 from datetime import datetime
-from typing import List, Dict
-import statistics
+from typing import Dict, List, Union
+
+import numpy as np
+import pandas as pd
 
 
 class MeterReading:
     """Represents a single meter reading at a specific timestamp."""
 
-    def __init__(self, timestamp: str, kwh: float, time_slot: str = None):
+    __slots__ = ('timestamp', 'kwh', 'time_slot')
+
+    def __init__(self, timestamp: Union[str, datetime, np.datetime64],
+                 kwh: float, time_slot: str = None):
         """
         Initialize a meter reading.
 
         Args:
-            timestamp: Date in format 'YYYY-MM-DD'
+            timestamp: Date as 'YYYY-MM-DD' string, datetime, or datetime64.
+                Already-parsed values are stored as-is to avoid a slow
+                strptime call per reading.
             kwh: Energy consumption in kilowatt-hours
             time_slot: Time of day (e.g., '08:00', '12:00')
         """
-        self.timestamp = datetime.strptime(timestamp, '%Y-%m-%d')
+        if isinstance(timestamp, str):
+            timestamp = datetime.strptime(timestamp, '%Y-%m-%d')
+        elif isinstance(timestamp, np.datetime64):
+            timestamp = timestamp.astype('datetime64[s]').astype(datetime)
+        self.timestamp = timestamp
         self.kwh = float(kwh)
         self.time_slot = time_slot
 
@@ -29,7 +40,16 @@ class MeterReading:
 
 
 class Building:
-    """Represents a campus building with meter readings and consumption analytics."""
+    """
+    Represents a campus building with meter readings and consumption analytics.
+
+    Readings are stored as parallel NumPy arrays (structure-of-arrays) so
+    the analytics run as vectorized C reductions instead of Python loops
+    over per-reading objects.
+    """
+
+    __slots__ = ('name', 'kwh', 'dates', 'time_slots',
+                 '_total_cache', '_peak_cache', '_min_cache', '_std_cache')
 
     def __init__(self, name: str):
         """
@@ -39,40 +59,97 @@ class Building:
             name: Name of the building
         """
         self.name = name
-        self.meter_readings: List[MeterReading] = []
+        self.kwh = np.empty(0, dtype=np.float64)
+        self.dates = np.empty(0, dtype='datetime64[D]')
+        self.time_slots = np.empty(0, dtype=object)
+        self._total_cache = None
+        self._peak_cache = None
+        self._min_cache = None
+        self._std_cache = None
+
+    @property
+    def reading_count(self) -> int:
+        """Number of meter readings stored for this building."""
+        return self.kwh.size
+
+    @property
+    def meter_readings(self) -> List[MeterReading]:
+        """Materialize readings as MeterReading objects (back-compat view)."""
+        readings = []
+        for date, kwh, time_slot in zip(self.dates, self.kwh, self.time_slots):
+            reading = MeterReading.__new__(MeterReading)
+            reading.timestamp = date.astype('datetime64[s]').astype(datetime)
+            reading.kwh = float(kwh)
+            reading.time_slot = time_slot
+            readings.append(reading)
+        return readings
+
+    def add_readings(self, kwh, dates, time_slots=None):
+        """
+        Bulk-append readings from parallel arrays.
+
+        Args:
+            kwh: Array-like of consumption values
+            dates: Array-like of dates (datetime64, datetime, or 'YYYY-MM-DD')
+            time_slots: Optional array-like of time-of-day labels
+        """
+        kwh = np.asarray(kwh, dtype=np.float64)
+        dates = np.asarray(dates, dtype='datetime64[D]')
+        if time_slots is None:
+            time_slots = np.full(kwh.size, None, dtype=object)
+        else:
+            time_slots = np.asarray(time_slots, dtype=object)
+
+        self.kwh = np.concatenate([self.kwh, kwh])
+        self.dates = np.concatenate([self.dates, dates])
+        self.time_slots = np.concatenate([self.time_slots, time_slots])
+
+        # New readings invalidate the memoized statistics
+        self._total_cache = None
+        self._peak_cache = None
+        self._min_cache = None
+        self._std_cache = None
 
     def add_reading(self, reading: MeterReading):
-        """Add a meter reading to the building."""
-        self.meter_readings.append(reading)
+        """Add a single meter reading (prefer add_readings for bulk loads)."""
+        self.add_readings([reading.kwh], [reading.timestamp],
+                          [reading.time_slot])
 
     def calculate_total_consumption(self) -> float:
         """Calculate total energy consumption across all readings."""
-        return sum(reading.kwh for reading in self.meter_readings)
+        if self._total_cache is None:
+            self._total_cache = float(self.kwh.sum())
+        return self._total_cache
 
     def calculate_average_consumption(self) -> float:
         """Calculate average energy consumption per reading."""
-        if not self.meter_readings:
+        if self.kwh.size == 0:
             return 0.0
-        return self.calculate_total_consumption() / len(self.meter_readings)
+        return self.calculate_total_consumption() / self.kwh.size
 
     def calculate_peak_consumption(self) -> float:
         """Calculate peak (maximum) energy consumption."""
-        if not self.meter_readings:
+        if self.kwh.size == 0:
             return 0.0
-        return max(reading.kwh for reading in self.meter_readings)
+        if self._peak_cache is None:
+            self._peak_cache = float(self.kwh.max())
+        return self._peak_cache
 
     def calculate_min_consumption(self) -> float:
         """Calculate minimum energy consumption."""
-        if not self.meter_readings:
+        if self.kwh.size == 0:
             return 0.0
-        return min(reading.kwh for reading in self.meter_readings)
+        if self._min_cache is None:
+            self._min_cache = float(self.kwh.min())
+        return self._min_cache
 
     def calculate_std_dev(self) -> float:
         """Calculate standard deviation of consumption."""
-        if len(self.meter_readings) < 2:
+        if self.kwh.size < 2:
             return 0.0
-        kwh_values = [reading.kwh for reading in self.meter_readings]
-        return statistics.stdev(kwh_values)
+        if self._std_cache is None:
+            self._std_cache = float(self.kwh.std(ddof=1))
+        return self._std_cache
 
     def get_daily_consumption(self) -> Dict[str, float]:
         """
@@ -81,12 +158,9 @@ class Building:
         Returns:
             Dictionary with date as key and total kWh as value
         """
-        daily_totals = {}
-        for reading in self.meter_readings:
-            date_key = reading.timestamp.strftime('%Y-%m-%d')
-            daily_totals[date_key] = daily_totals.get(
-                date_key, 0) + reading.kwh
-        return daily_totals
+        daily = pd.Series(self.kwh).groupby(self.dates).sum()
+        return {date.strftime('%Y-%m-%d'): float(total)
+                for date, total in daily.items()}
 
     def get_hourly_breakdown(self, date: str) -> Dict[str, float]:
         """
@@ -98,11 +172,9 @@ class Building:
         Returns:
             Dictionary with time slot as key and kWh as value
         """
-        hourly_data = {}
-        for reading in self.meter_readings:
-            if reading.timestamp.strftime('%Y-%m-%d') == date:
-                hourly_data[reading.time_slot] = reading.kwh
-        return hourly_data
+        mask = self.dates == np.datetime64(date)
+        return {time_slot: float(kwh)
+                for time_slot, kwh in zip(self.time_slots[mask], self.kwh[mask])}
 
     def generate_report(self) -> str:
         """Generate a text report with building statistics."""
@@ -116,7 +188,7 @@ class Building:
         ========================================
         BUILDING: {self.name}
         ========================================
-        Total Readings: {len(self.meter_readings)}
+        Total Readings: {self.reading_count}
         Total Consumption: {total:.2f} kWh
         Average Consumption: {avg:.2f} kWh/reading
         Peak Consumption: {peak:.2f} kWh
@@ -127,7 +199,7 @@ class Building:
         return report
 
     def __repr__(self):
-        return f"Building({self.name}, {len(self.meter_readings)} readings)"
+        return f"Building({self.name}, {self.reading_count} readings)"
 
 
 class BuildingManager:
@@ -199,40 +271,53 @@ class BuildingManager:
                 'peak': building.calculate_peak_consumption(),
                 'minimum': building.calculate_min_consumption(),
                 'std_dev': building.calculate_std_dev(),
-                'readings': len(building.meter_readings)
+                'readings': building.reading_count
             }
         return summary
 
     def generate_campus_report(self) -> str:
         """Generate a comprehensive campus-wide report."""
-        campus_total = self.calculate_campus_total()
-        highest_name, highest_value = self.get_highest_consumer()
-        lowest_name, lowest_value = self.get_lowest_consumer()
-
-        report = f"""
+        # Compute each building's total once and reuse it everywhere below
+        totals = {name: building.calculate_total_consumption()
+                  for name, building in self.buildings.items()}
+        campus_total = sum(totals.values())
+
+        if totals:
+            highest_name = max(totals, key=totals.get)
+            lowest_name = min(totals, key=totals.get)
+            highest_value = totals[highest_name]
+            lowest_value = totals[lowest_name]
+        else:
+            highest_name = lowest_name = None
+            highest_value = lowest_value = 0.0
+
+        header = f"""
         ========================================
         CAMPUS-WIDE ENERGY SUMMARY
         ========================================
         Total Buildings: {len(self.buildings)}
         Campus Total Consumption: {campus_total:.2f} kWh
-        
+
         Highest Consumer: {highest_name}
         - Consumption: {highest_value:.2f} kWh
-        
+
         Lowest Consumer: {lowest_name}
         - Consumption: {lowest_value:.2f} kWh
-        
+
         Percentage Distribution:
         """
 
-        for name, building in sorted(self.buildings.items()):
-            total = building.calculate_total_consumption()
+        # Collect lines and join once instead of growing the string
+        # quadratically with +=
+        lines = [header]
+        for name in sorted(totals):
+            total = totals[name]
             percentage = (total / campus_total *
                           100) if campus_total > 0 else 0
-            report += f"\n        {name}: {percentage:.1f}% ({total:.2f} kWh)"
+            lines.append(f"\n        {name}: {percentage:.1f}% ({total:.2f} kWh)")
 
-        report += "\n        ========================================"
-        return report
+        lines.append("\n        ========================================")
+        return ''.join(lines)
 
     def __repr__(self):
         return f"BuildingManager({len(self.buildings)} buildings)"